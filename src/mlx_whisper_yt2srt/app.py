@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from .config import (
+    AUTO_MODEL_SIZE,
+    DEFAULT_AUDIO_FORMAT,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MODEL_SIZE,
+    MAX_PARALLEL_DOWNLOADS,
+)
+from .errors import Yt2SrtError
+from .models import warm_model
 from .progress import ProgressCallback, emit_progress
 from .transcription import generate_srt
-from .youtube import download_youtube_audio
+from .youtube import download_youtube_audio, video_id_from_url
 
 
 @dataclass(frozen=True)
@@ -14,9 +26,12 @@ class ConversionOptions:
 
     youtube_url: str
     language: str = "auto"
-    model_size: str = "turbo-4bit"
-    audio_format: str = "mp3"
+    model_size: str = DEFAULT_MODEL_SIZE
+    audio_format: str = DEFAULT_AUDIO_FORMAT
     workspace_dir: Path = Path("whisper_workspace")
+    temperature_fallback: bool = False
+    vad: bool = False
+    batch_size: int = DEFAULT_BATCH_SIZE
 
 
 def convert_youtube_to_srt(
@@ -26,16 +41,133 @@ def convert_youtube_to_srt(
 ) -> Path:
     """Download YouTube audio, transcribe it, and return the generated SRT path."""
 
+    warmups = _start_model_warmups([options.model_size])
     audio_path = download_youtube_audio(
         options.youtube_url,
         audio_format=options.audio_format,
         workspace_dir=options.workspace_dir,
         progress=progress,
     )
+    _finish_model_warmups(*warmups)
     emit_progress(progress, "Starting subtitle generation...")
     return generate_srt(
         audio_path,
         model_size=options.model_size,
         language=options.language,
+        temperature_fallback=options.temperature_fallback,
+        vad=options.vad,
+        batch_size=options.batch_size,
         progress=progress,
     )
+
+
+def convert_youtube_batch(
+    options: Sequence[ConversionOptions],
+    *,
+    progress: ProgressCallback | None = None,
+) -> list[Path]:
+    """Convert several YouTube URLs, downloading their audio in parallel.
+
+    Transcription runs sequentially in input order in this process, so each MLX
+    Whisper model is loaded once and reused for every file that selects it, while
+    the remaining downloads continue in the background. On failure, queued
+    downloads are cancelled and the error is raised without waiting for the ones
+    already running. Each video must use a single audio format within a batch.
+    """
+
+    if not options:
+        return []
+
+    # Every format of a video is written through the same yt-dlp output template,
+    # and extracting one format deletes the source file another one relies on.
+    audio_formats: dict[tuple[str, Path], str] = {}
+    for item in options:
+        audio_format = audio_formats.setdefault(_download_key(item), item.audio_format)
+        if audio_format != item.audio_format:
+            raise Yt2SrtError(
+                f"{item.youtube_url} is requested as both {audio_format} and "
+                f"{item.audio_format} audio; use one audio format per video in a batch.",
+            )
+
+    warmups = _start_model_warmups([item.model_size for item in options])
+    pool = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DOWNLOADS, len(options)))
+    try:
+        downloads: dict[tuple[str, Path], Future[Path]] = {}
+        for item in options:
+            key = _download_key(item)
+            if key not in downloads:
+                downloads[key] = pool.submit(
+                    download_youtube_audio,
+                    item.youtube_url,
+                    audio_format=item.audio_format,
+                    workspace_dir=item.workspace_dir,
+                    progress=progress,
+                )
+        _finish_model_warmups(*warmups)
+
+        srt_paths = []
+        for item in options:
+            audio_path = downloads[_download_key(item)].result()
+            emit_progress(progress, f"Starting subtitle generation for {item.youtube_url}...")
+            srt_paths.append(
+                generate_srt(
+                    audio_path,
+                    model_size=item.model_size,
+                    language=item.language,
+                    temperature_fallback=item.temperature_fallback,
+                    vad=item.vad,
+                    batch_size=item.batch_size,
+                    progress=progress,
+                ),
+            )
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    return srt_paths
+
+
+def _download_key(options: ConversionOptions) -> tuple[str, Path]:
+    # Different URL forms of one video share an output file, so they share a download.
+    video_key = video_id_from_url(options.youtube_url) or options.youtube_url
+    return video_key, options.workspace_dir
+
+
+def _start_model_warmups(
+    model_sizes: Sequence[str],
+) -> tuple[list[threading.Thread], dict[str, Exception]]:
+    # Model loading is disk and Metal bound, so it overlaps with the network-bound
+    # download instead of starting after it. "auto" is only resolved after decoding.
+    # Errors stay with this conversion, so a failure never outlives it.
+    errors: dict[str, Exception] = {}
+
+    def warm(model_size: str) -> None:
+        error = warm_model(model_size)
+        if error is not None:
+            errors[model_size] = error
+
+    warmups = [
+        threading.Thread(target=warm, args=(model_size,), daemon=True)
+        for model_size in dict.fromkeys(model_sizes)
+        if model_size.lower() != AUTO_MODEL_SIZE
+    ]
+    for warmup in warmups:
+        warmup.start()
+    return warmups, errors
+
+
+def _finish_model_warmups(
+    warmups: Sequence[threading.Thread],
+    errors: dict[str, Exception],
+) -> None:
+    # A failed warm-up is reported as is; retrying would repeat a slow download.
+    _join_all(warmups)
+    for model_size, error in errors.items():
+        raise Yt2SrtError(
+            f"MLX Whisper model '{model_size}' could not be loaded: {error}",
+        ) from error
+
+
+def _join_all(threads: Sequence[threading.Thread]) -> None:
+    for thread in threads:
+        thread.join()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SAMPLE_RATE = 16000
+PCM_CACHE_SUFFIX = ".pcm16.npy"
+# MLX Whisper's ffmpeg loader decodes to signed 16-bit samples and divides by this.
+_INT16_SCALE = 32768.0
+
+
+def load_pcm(audio_file: Path) -> np.ndarray:
+    """Return 16 kHz mono float32 PCM for an audio file, decoding it at most once.
+
+    Decoded samples are cached next to the audio file as 16-bit PCM, which is
+    exactly what ffmpeg produced, so later runs on the same file skip ffmpeg. The
+    cache is ignored when the audio file is newer than it.
+    """
+
+    import numpy as np
+
+    cache_file = pcm_cache_path(audio_file)
+    try:
+        if cache_file.stat().st_mtime >= audio_file.stat().st_mtime:
+            return np.load(cache_file).astype(np.float32) / _INT16_SCALE
+    except (EOFError, OSError, ValueError):
+        pass
+
+    from mlx_whisper.audio import load_audio
+
+    pcm = np.asarray(load_audio(str(audio_file), sr=SAMPLE_RATE), dtype=np.float32)
+    _write_pcm_cache(cache_file, np.round(pcm * _INT16_SCALE).astype(np.int16))
+    return pcm
+
+
+def pcm_cache_path(audio_file: Path) -> Path:
+    """Return the decoded PCM cache path for ``audio_file``."""
+
+    return audio_file.with_name(f"{audio_file.name}{PCM_CACHE_SUFFIX}")
+
+
+def _write_pcm_cache(cache_file: Path, samples: np.ndarray) -> None:
+    import numpy as np
+
+    try:
+        fd, temp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as file:
+            np.save(file, samples)
+        os.replace(temp_name, cache_file)
+    except OSError:
+        Path(temp_name).unlink(missing_ok=True)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from .audio import SAMPLE_RATE
+from .vad import FRAME_SECONDS, frame_levels
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Whisper decodes 30-second windows and emits timestamps in 20 ms steps.
+WINDOW_SECONDS = 30.0
+TIME_PRECISION = 0.02
+# Long regions are cut at the quietest frame within this many seconds of a full window.
+CUT_SEARCH_SECONDS = 5.0
+# Same thresholds mlx_whisper.transcribe uses to drop windows without speech.
+NO_SPEECH_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+
+
+def transcribe_regions(
+    model: Any,
+    audio: np.ndarray,
+    regions: Sequence[tuple[float, float]],
+    *,
+    language: str | None,
+    batch_size: int,
+) -> list[dict[str, Any]]:
+    """Greedily transcribe speech regions, encoding up to ``batch_size`` windows at once.
+
+    Each region is cut into windows of at most 30 seconds. Their log-Mel
+    spectrograms are stacked so the encoder and the decoder loop run once per
+    batch instead of once per window. The decoder loop itself is MLX Whisper's,
+    which pipelines steps with ``mx.async_eval``. Returned segment times are on
+    the timeline of ``audio``.
+    """
+
+    import mlx.core as mx
+    from mlx_whisper.audio import N_FRAMES, N_SAMPLES, log_mel_spectrogram, pad_or_trim
+    from mlx_whisper.decoding import DecodingOptions, decode
+    from mlx_whisper.tokenizer import get_tokenizer
+
+    if language is None and not model.is_multilingual:
+        language = "en"
+    tokenizer = get_tokenizer(model.is_multilingual, num_languages=model.num_languages)
+    options = DecodingOptions(language=language, temperature=0.0, fp16=True)
+
+    levels = None
+    if any(end - start > WINDOW_SECONDS for start, end in regions):
+        levels = frame_levels(audio)
+    windows = split_regions(regions, levels=levels)
+    segments: list[dict[str, Any]] = []
+    for first in range(0, len(windows), batch_size):
+        batch = windows[first : first + batch_size]
+        # Pad the waveform rather than the spectrogram, as mlx_whisper.transcribe
+        # does, so frames past the end of a short window hold the silence floor.
+        mels = mx.stack(
+            [
+                pad_or_trim(
+                    log_mel_spectrogram(
+                        audio[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)],
+                        n_mels=model.dims.n_mels,
+                        padding=N_SAMPLES,
+                    ),
+                    N_FRAMES,
+                    axis=-2,
+                )
+                for start, end in batch
+            ],
+        ).astype(mx.float16)
+
+        for (start, end), result in zip(batch, decode(model, mels, options), strict=True):
+            if (
+                result.no_speech_prob > NO_SPEECH_THRESHOLD
+                and result.avg_logprob < LOGPROB_THRESHOLD
+            ):
+                continue
+            segments.extend(
+                timestamped_segments(
+                    result.tokens,
+                    timestamp_begin=tokenizer.timestamp_begin,
+                    decode_text=tokenizer.decode,
+                    start=start,
+                    end=end,
+                ),
+            )
+    return segments
+
+
+def split_regions(
+    regions: Sequence[tuple[float, float]],
+    max_seconds: float = WINDOW_SECONDS,
+    *,
+    levels: np.ndarray | None = None,
+) -> list[tuple[float, float]]:
+    """Cut regions longer than ``max_seconds`` into consecutive windows.
+
+    With per-frame ``levels`` from :func:`~mlx_whisper_yt2srt.vad.frame_levels`,
+    each cut is placed at the quietest frame in the last ``CUT_SEARCH_SECONDS``
+    of the window, so words are rarely split between windows.
+    """
+
+    windows = []
+    for start, end in regions:
+        while end - start > max_seconds:
+            cut = start + max_seconds
+            if levels is not None:
+                cut = _quietest_time(levels, cut - CUT_SEARCH_SECONDS, cut)
+            windows.append((start, cut))
+            start = cut
+        windows.append((start, end))
+    return windows
+
+
+def _quietest_time(levels: np.ndarray, earliest: float, latest: float) -> float:
+    # Only frames that lie entirely within [earliest, latest] are candidates.
+    first = math.ceil(earliest / FRAME_SECONDS)
+    last = min(len(levels), math.floor(latest / FRAME_SECONDS))
+    if first >= last:
+        return latest
+    quietest = first + int(levels[first:last].argmin())
+    return (quietest + 0.5) * FRAME_SECONDS
+
+
+def timestamped_segments(
+    tokens: Sequence[int],
+    *,
+    timestamp_begin: int,
+    decode_text: Callable[[list[int]], str],
+    start: float,
+    end: float,
+) -> list[dict[str, Any]]:
+    """Split decoded tokens into segments at Whisper's timestamp tokens.
+
+    Timestamps are relative to ``start``; text after the last timestamp ends at
+    ``end``.
+    """
+
+    segments = []
+    segment_start = start
+    text_tokens: list[int] = []
+    for token in tokens:
+        if token < timestamp_begin:
+            text_tokens.append(token)
+            continue
+
+        time = min(end, start + (token - timestamp_begin) * TIME_PRECISION)
+        if text_tokens:
+            segments.append(
+                {"start": segment_start, "end": time, "text": decode_text(text_tokens)},
+            )
+            text_tokens = []
+        segment_start = time
+
+    if text_tokens:
+        segments.append({"start": segment_start, "end": end, "text": decode_text(text_tokens)})
+    return [segment for segment in segments if segment["text"].strip()]
@@ -6,9 +6,18 @@ from collections.abc import Sequence
 from pathlib import Path
 
 from . import __version__
-from .app import ConversionOptions, convert_youtube_to_srt
-from .config import AUDIO_FORMATS, DEFAULT_AUDIO_FORMAT, DEFAULT_MODEL_SIZE, MODEL_REPOS
+from .app import ConversionOptions, convert_youtube_batch, convert_youtube_to_srt
+from .config import (
+    AUDIO_FORMATS,
+    AUTO_MODEL_SIZE,
+    DEFAULT_AUDIO_FORMAT,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MODEL_SIZE,
+    MODEL_REPOS,
+    QUANTIZATIONS,
+)
 from .errors import Yt2SrtError
+from .models import resolve_model_size
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -19,9 +28,13 @@ def build_parser() -> argparse.ArgumentParser:
         description="Convert a YouTube video to an SRT subtitle file using MLX Whisper.",
     )
     parser.add_argument(
-        "youtube_url",
-        nargs="?",
-        help="YouTube video URL, including youtube.com, youtu.be, shorts, and embed URLs.",
+        "youtube_urls",
+        nargs="*",
+        metavar="youtube_url",
+        help=(
+            "YouTube video URL, including youtube.com, youtu.be, shorts, and embed URLs. "
+            "Pass several URLs to download them all first and reuse one loaded model."
+        ),
     )
     parser.add_argument(
         "--language",
@@ -32,10 +45,16 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--model",
         "-m",
-        choices=tuple(MODEL_REPOS),
+        choices=(AUTO_MODEL_SIZE, *MODEL_REPOS),
         default=DEFAULT_MODEL_SIZE,
         help=f"Whisper model size to use. Default: {DEFAULT_MODEL_SIZE}.",
     )
+    parser.add_argument(
+        "--quantization",
+        "-q",
+        choices=QUANTIZATIONS,
+        help="Weight quantization for the selected model size. Default: implied by --model.",
+    )
     parser.add_argument(
         "--audio-format",
         "-a",
@@ -50,6 +69,26 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Directory for downloaded audio and generated SRT files.",
     )
+    parser.add_argument(
+        "--temperature-fallback",
+        action="store_true",
+        help="Retry low-confidence windows at higher temperatures. Slower but more robust.",
+    )
+    parser.add_argument(
+        "--vad",
+        action="store_true",
+        help="Skip silent stretches of audio with energy-based voice activity detection.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        "-b",
+        type=_positive_int,
+        default=DEFAULT_BATCH_SIZE,
+        help=(
+            "Number of 30-second speech windows decoded together with --vad. "
+            f"Default: {DEFAULT_BATCH_SIZE}."
+        ),
+    )
     parser.add_argument(
         "--interactive",
         "-i",
@@ -70,25 +109,41 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    if args.interactive or not args.youtube_url:
+    if args.interactive or not args.youtube_urls:
         args = _prompt_for_missing_options(args)
 
-    options = ConversionOptions(
-        youtube_url=args.youtube_url,
-        language=args.language,
-        model_size=args.model,
-        audio_format=args.audio_format,
-        workspace_dir=args.workspace,
-    )
+    try:
+        model_size = resolve_model_size(args.model, args.quantization)
+    except Yt2SrtError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
 
-    print(f"Processing URL: {options.youtube_url}")
-    print(f"Using language: {options.language}")
-    print(f"Using model: {options.model_size}")
-    print(f"Audio format: {options.audio_format}")
-    print(f"Workspace: {options.workspace_dir}")
+    options = [
+        ConversionOptions(
+            youtube_url=youtube_url,
+            language=args.language,
+            model_size=model_size,
+            audio_format=args.audio_format,
+            workspace_dir=args.workspace,
+            temperature_fallback=args.temperature_fallback,
+            vad=args.vad,
+            batch_size=args.batch_size,
+        )
+        for youtube_url in args.youtube_urls
+    ]
+
+    for item in options:
+        print(f"Processing URL: {item.youtube_url}")
+    print(f"Using language: {args.language}")
+    print(f"Using model: {model_size}")
+    print(f"Audio format: {args.audio_format}")
+    print(f"Workspace: {args.workspace}")
 
     try:
-        srt_file = convert_youtube_to_srt(options, progress=print)
+        if len(options) == 1:
+            srt_files = [convert_youtube_to_srt(options[0], progress=print)]
+        else:
+            srt_files = convert_youtube_batch(options, progress=print)
     except KeyboardInterrupt:
         print("Interrupted.", file=sys.stderr)
         return 130
@@ -96,16 +151,27 @@ def main(argv: Sequence[str] | None = None) -> int:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
-    print(f"Done! The SRT file is saved at: {srt_file}")
+    for srt_file in srt_files:
+        print(f"Done! The SRT file is saved at: {srt_file}")
     return 0
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return number
+
+
 def _prompt_for_missing_options(args: argparse.Namespace) -> argparse.Namespace:
     print("YouTube to SRT Converter")
     print("========================")
 
-    if not args.youtube_url:
-        args.youtube_url = input("Enter YouTube video URL: ").strip()
+    if not args.youtube_urls:
+        args.youtube_urls = [input("Enter YouTube video URL: ").strip()]
 
     if args.language == "auto":
         lang_input = input("Language code (ja, en, auto / default: auto): ").strip()
@@ -113,7 +179,7 @@ def _prompt_for_missing_options(args: argparse.Namespace) -> argparse.Namespace:
 
     if args.model == DEFAULT_MODEL_SIZE:
         print("Available model sizes:")
-        for model_name in MODEL_REPOS:
+        for model_name in (AUTO_MODEL_SIZE, *MODEL_REPOS):
             print(f"- {model_name}")
         model_input = input(f"Model size (default: {DEFAULT_MODEL_SIZE}): ").strip()
         args.model = model_input or DEFAULT_MODEL_SIZE
@@ -1,17 +1,54 @@
 from __future__ import annotations
 
-DEFAULT_AUDIO_FORMAT = "mp3"
-DEFAULT_MODEL_SIZE = "turbo-4bit"
+DEFAULT_AUDIO_FORMAT = "best"
+DEFAULT_MODEL_SIZE = "turbo-int8"
+# "auto" picks a model from the audio duration: int8 keeps accuracy on short
+# audio, and 4-bit weights speed up the bandwidth-bound decoder on long audio.
+AUTO_MODEL_SIZE = "auto"
+AUTO_SHORT_MODEL_SIZE = "turbo-int8"
+AUTO_LONG_MODEL_SIZE = "turbo-4bit"
+AUTO_LONG_AUDIO_SECONDS = 600.0
+# 30-second windows encoded together when transcribing voice activity regions.
+DEFAULT_BATCH_SIZE = 8
+# Concurrent yt-dlp downloads when converting several URLs.
+MAX_PARALLEL_DOWNLOADS = 8
 
-AUDIO_FORMATS = ("mp3", "wav", "m4a")
+# "best" keeps the downloaded audio stream without re-encoding it; MLX Whisper
+# decodes it with ffmpeg directly.
+AUDIO_FORMATS = ("best", "mp3", "wav", "m4a")
+# Extensions yt-dlp writes when extracting audio with the "best" format.
+SOURCE_AUDIO_EXTENSIONS = ("m4a", "opus", "ogg", "webm", "mp3", "aac", "flac", "wav")
+
+QUANTIZATIONS = ("int4", "int8", "fp16")
+QUANTIZATION_SUFFIXES = {"int4": "4bit", "int8": "int8"}
+QUANTIZATION_BITS = {"int4": 4, "int8": 8}
+QUANTIZATION_GROUP_SIZE = 64
 
 MODEL_REPOS = {
     "tiny": "mlx-community/whisper-tiny-mlx",
+    "tiny-4bit": "mlx-community/whisper-tiny-mlx-4bit",
+    "tiny-int8": "mlx-community/whisper-tiny-mlx-8bit",
     "base": "mlx-community/whisper-base-mlx",
+    "base-4bit": "mlx-community/whisper-base-mlx-4bit",
+    "base-int8": "mlx-community/whisper-base-mlx-8bit",
     "small": "mlx-community/whisper-small-mlx",
+    "small-4bit": "mlx-community/whisper-small-mlx-4bit",
+    "small-int8": "mlx-community/whisper-small-mlx-8bit",
     "medium": "mlx-community/whisper-medium-mlx",
+    "medium-4bit": "mlx-community/whisper-medium-mlx-4bit",
+    "medium-int8": "mlx-community/whisper-medium-mlx-8bit",
     "large": "mlx-community/whisper-large-v3-mlx",
     "large-4bit": "mlx-community/whisper-large-v3-mlx-4bit",
+    "large-int8": "mlx-community/whisper-large-v3-mlx-8bit",
     "turbo": "mlx-community/whisper-large-v3-turbo",
     "turbo-4bit": "mlx-community/whisper-large-v3-turbo-q4",
+    "turbo-int8": "mlx-community/whisper-large-v3-turbo-q8",
+    "turbo-mixed": "mlx-community/whisper-large-v3-turbo",
+}
+
+# Models quantized per component at load time, as (encoder bits, decoder bits).
+# The encoder runs once per window and is accuracy-sensitive; the decoder runs
+# once per token and is bound by weight bandwidth.
+MIXED_PRECISION_MODELS = {
+    "turbo-mixed": (8, 4),
 }
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import importlib
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+from .config import (
+    AUTO_LONG_AUDIO_SECONDS,
+    AUTO_LONG_MODEL_SIZE,
+    AUTO_MODEL_SIZE,
+    AUTO_SHORT_MODEL_SIZE,
+    MIXED_PRECISION_MODELS,
+    MODEL_REPOS,
+    QUANTIZATION_BITS,
+    QUANTIZATION_GROUP_SIZE,
+    QUANTIZATION_SUFFIXES,
+)
+from .errors import Yt2SrtError
+
+_MODEL_CACHE: dict[str, Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def resolve_model_repo(model_size: str) -> str:
+    """Return the Hugging Face repository for a configured model size."""
+
+    model_repo = MODEL_REPOS.get(model_size.lower())
+    if model_repo is None:
+        allowed = ", ".join(MODEL_REPOS)
+        raise Yt2SrtError(f"Unknown model '{model_size}'. Choose one of: {allowed}")
+    return model_repo
+
+
+def resolve_model_size(model_size: str, quantization: str | None = None) -> str:
+    """Return the model name for ``model_size`` at the requested quantization.
+
+    ``None`` keeps the quantization implied by ``model_size``; ``fp16`` selects the
+    unquantized model.
+    """
+
+    model_size = model_size.lower()
+    if quantization is None:
+        return model_size
+    if model_size == AUTO_MODEL_SIZE:
+        raise Yt2SrtError("The 'auto' model chooses its own quantization.")
+
+    base_size, _ = split_model_size(model_size)
+    if quantization == "fp16":
+        return base_size
+
+    suffix = QUANTIZATION_SUFFIXES.get(quantization)
+    if suffix is None:
+        allowed = ", ".join(("fp16", *QUANTIZATION_SUFFIXES))
+        raise Yt2SrtError(f"Unknown quantization '{quantization}'. Choose one of: {allowed}")
+    return f"{base_size}-{suffix}"
+
+
+def pick_model_size(duration_seconds: float) -> str:
+    """Return the model that ``auto`` selects for audio of the given duration."""
+
+    if duration_seconds < AUTO_LONG_AUDIO_SECONDS:
+        return AUTO_SHORT_MODEL_SIZE
+    return AUTO_LONG_MODEL_SIZE
+
+
+def split_model_size(model_size: str) -> tuple[str, str | None]:
+    """Split a model name into its base size and quantization, if any."""
+
+    base_size, _, suffix = model_size.lower().partition("-")
+    for quantization, quantization_suffix in QUANTIZATION_SUFFIXES.items():
+        if suffix == quantization_suffix:
+            return base_size, quantization
+    return base_size, None
+
+
+def load_model(model_size: str) -> Any:
+    """Load an MLX Whisper model once per process and return the cached instance."""
+
+    model_size = model_size.lower()
+    model_repo = resolve_model_repo(model_size)
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(model_size)
+        if model is None:
+            model = _load_uncached_model(model_size, model_repo)
+            _MODEL_CACHE[model_size] = model
+    return model
+
+
+def warm_model(model_size: str) -> Exception | None:
+    """Populate the model cache ahead of transcription and return any load error.
+
+    The error is returned rather than raised so a background thread can hand it
+    to the conversion that started it.
+    """
+
+    try:
+        load_model(model_size)
+    except Exception as exc:
+        return exc
+    return None
+
+
+def activate_model(model_size: str) -> str:
+    """Make ``mlx_whisper.transcribe`` reuse the cached model for ``model_size``.
+
+    ``mlx_whisper.transcribe`` keeps only the most recently used model and reloads
+    weights whenever the repository changes, so the cached instance is installed
+    into its holder before every call. Returns the repository to pass as
+    ``path_or_hf_repo``.
+    """
+
+    model_repo = resolve_model_repo(model_size)
+    model = load_model(model_size)
+    holder = importlib.import_module("mlx_whisper.transcribe").ModelHolder
+    holder.model = model
+    holder.model_path = model_repo
+    return model_repo
+
+
+def _load_uncached_model(model_size: str, model_repo: str) -> Any:
+    import mlx.core as mx
+    from huggingface_hub.utils import (
+        EntryNotFoundError,
+        LocalEntryNotFoundError,
+        RepositoryNotFoundError,
+    )
+    from mlx_whisper.load_models import load_model as load_whisper_model
+
+    mixed_precision = MIXED_PRECISION_MODELS.get(model_size)
+    if mixed_precision is not None:
+        encoder_bits, decoder_bits = mixed_precision
+        model = load_whisper_model(_safetensors_model_dir(model_repo), dtype=mx.float16)
+        _quantize(model.encoder, bits=encoder_bits)
+        _quantize(model.decoder, bits=decoder_bits)
+        return model
+
+    try:
+        return load_whisper_model(_safetensors_model_dir(model_repo), dtype=mx.float16)
+    except (RepositoryNotFoundError, EntryNotFoundError) as exc:
+        # LocalEntryNotFoundError means offline and not cached, not a missing repository.
+        base_size, quantization = split_model_size(model_size)
+        if (
+            isinstance(exc, LocalEntryNotFoundError)
+            or quantization is None
+            or base_size not in MODEL_REPOS
+        ):
+            raise
+        missing_repo_error = exc
+
+    # The pre-quantized repository does not exist; quantize the fp16 weights instead.
+    try:
+        model = load_whisper_model(
+            _safetensors_model_dir(MODEL_REPOS[base_size]),
+            dtype=mx.float16,
+        )
+    except Exception as fallback_error:
+        raise missing_repo_error from fallback_error
+    _quantize(model, bits=QUANTIZATION_BITS[quantization])
+    return model
+
+
+def _safetensors_model_dir(model_repo: str) -> str:
+    """Return a local directory for ``model_repo`` whose weights are safetensors.
+
+    MLX loads safetensors lazily from a memory map, while ``weights.npz`` must be
+    decompressed in full on every load. Repositories that only ship npz weights
+    are converted once per revision into the user cache directory.
+    """
+
+    import mlx.core as mx
+    from huggingface_hub import snapshot_download
+
+    snapshot_dir = Path(model_repo)
+    if not snapshot_dir.exists():
+        snapshot_dir = Path(snapshot_download(repo_id=model_repo))
+    npz_weights = snapshot_dir / "weights.npz"
+    if (snapshot_dir / "weights.safetensors").exists() or not npz_weights.exists():
+        return str(snapshot_dir)
+
+    converted_dir = _converted_models_dir() / model_repo.replace("/", "--") / snapshot_dir.name
+    weights = converted_dir / "weights.safetensors"
+    if not weights.exists():
+        converted_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(snapshot_dir / "config.json", converted_dir / "config.json")
+        temp_weights = converted_dir / f"weights.{os.getpid()}.tmp.safetensors"
+        mx.save_safetensors(str(temp_weights), dict(mx.load(str(npz_weights))))
+        os.replace(temp_weights, weights)
+    return str(converted_dir)
+
+
+def _converted_models_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "mlx_whisper_yt2srt" / "models"
+
+
+def _quantize(module: Any, *, bits: int) -> None:
+    import mlx.core as mx
+    import mlx.nn as nn
+
+    nn.quantize(module, group_size=QUANTIZATION_GROUP_SIZE, bits=bits)
+    mx.eval(module.parameters())
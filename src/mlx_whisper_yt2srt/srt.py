@@ -17,12 +17,12 @@ def format_srt_timestamp(seconds: float) -> str:
 def write_srt(segments: Iterable[Mapping[str, object]], srt_path: Path) -> None:
     """Write transcription segments to an SRT file."""
 
-    with srt_path.open("w", encoding="utf-8") as file:
-        for index, segment in enumerate(segments, start=1):
-            start_time = format_srt_timestamp(float(segment["start"]))
-            end_time = format_srt_timestamp(float(segment["end"]))
-            text = str(segment["text"]).strip()
-
-            file.write(f"{index}\n")
-            file.write(f"{start_time} --> {end_time}\n")
-            file.write(f"{text}\n\n")
+    blocks = [
+        f"{index}\n"
+        f"{format_srt_timestamp(float(segment['start']))} --> "
+        f"{format_srt_timestamp(float(segment['end']))}\n"
+        f"{str(segment['text']).strip()}\n\n"
+        for index, segment in enumerate(segments, start=1)
+    ]
+    # Encode once and write bytes directly, bypassing the text I/O layer.
+    srt_path.write_bytes("".join(blocks).encode("utf-8"))
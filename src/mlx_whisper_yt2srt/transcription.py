@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import uuid
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .config import DEFAULT_MODEL_SIZE, MODEL_REPOS
+from .audio import SAMPLE_RATE, load_pcm
+from .batched import transcribe_regions
+from .config import AUTO_MODEL_SIZE, DEFAULT_BATCH_SIZE, DEFAULT_MODEL_SIZE
 from .errors import Yt2SrtError
+from .models import activate_model, load_model, pick_model_size, resolve_model_repo
 from .progress import ProgressCallback, emit_progress
 from .srt import write_srt
+from .vad import detect_speech
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def generate_srt(
@@ -15,25 +23,51 @@ def generate_srt(
     *,
     model_size: str = DEFAULT_MODEL_SIZE,
     language: str = "auto",
+    temperature_fallback: bool = False,
+    vad: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
     progress: ProgressCallback | None = None,
 ) -> Path:
-    """Transcribe an audio file with MLX Whisper and write an SRT file."""
-
-    audio_file = audio_file.expanduser().resolve()
-    if not audio_file.exists():
-        raise Yt2SrtError(f"Audio file not found: {audio_file}")
-
-    model_repo = MODEL_REPOS.get(model_size.lower())
-    if model_repo is None:
-        allowed = ", ".join(MODEL_REPOS)
-        raise Yt2SrtError(f"Unknown model '{model_size}'. Choose one of: {allowed}")
-
-    emit_progress(progress, f"Loading MLX Whisper model '{model_repo}'...")
-
-    transcribe_kwargs: dict[str, Any] = {}
+    """Transcribe an audio file with MLX Whisper and write an SRT file.
+
+    Decoding is greedy and each 30-second window is decoded independently of the
+    previous text. ``temperature_fallback`` re-enables MLX Whisper's retries at
+    higher temperatures for windows that fail its quality checks. ``vad`` skips
+    silent stretches of audio instead of decoding them; its speech regions are
+    decoded ``batch_size`` windows at a time unless ``batch_size`` is 1 or
+    ``temperature_fallback`` is set. The ``auto`` model size is resolved from the
+    audio duration.
+    """
+
+    # A strict resolve checks existence in the same pass that normalizes the path.
+    # Python 3.11 and 3.12 raise RuntimeError for symlink loops.
+    try:
+        audio_file = audio_file.expanduser().resolve(strict=True)
+    except FileNotFoundError as exc:
+        raise Yt2SrtError(f"Audio file not found: {audio_file}") from exc
+    except (OSError, RuntimeError) as exc:
+        raise Yt2SrtError(f"Audio file could not be accessed: {audio_file}: {exc}") from exc
+
+    if batch_size < 1:
+        raise Yt2SrtError(f"Batch size must be at least 1, got {batch_size}.")
+
+    auto_model = model_size.lower() == AUTO_MODEL_SIZE
+    if not auto_model:
+        resolve_model_repo(model_size)
+
+    # SRT output only needs segment timing, so word alignment stays off.
+    transcribe_kwargs: dict[str, Any] = {
+        "condition_on_previous_text": False,
+        "word_timestamps": False,
+        "fp16": True,
+    }
+    if not temperature_fallback:
+        transcribe_kwargs["temperature"] = 0.0
     if language.lower() != "auto":
         transcribe_kwargs["language"] = language
 
+    # mlx-whisper 0.4.0 and later overlap each decoder step with the next one via
+    # mx.async_eval; pyproject.toml requires >=0.4.2, so no custom decode loop is needed.
     try:
         import mlx_whisper
     except ImportError as exc:
@@ -42,25 +76,105 @@ def generate_srt(
         ) from exc
 
     try:
-        result = mlx_whisper.transcribe(
-            str(audio_file),
-            path_or_hf_repo=model_repo,
-            **transcribe_kwargs,
+        audio = load_pcm(audio_file)
+    except Exception as exc:
+        raise Yt2SrtError(f"Audio decoding failed: {exc}") from exc
+
+    if auto_model:
+        duration = len(audio) / SAMPLE_RATE
+        model_size = pick_model_size(duration)
+        emit_progress(
+            progress,
+            f"Selected model '{model_size}' for {duration / 60:.1f} minutes of audio.",
         )
+
+    model_repo = resolve_model_repo(model_size)
+    emit_progress(progress, f"Loading MLX Whisper model '{model_repo}'...")
+    try:
+        activate_model(model_size)
     except Exception as exc:
-        raise Yt2SrtError(f"MLX Whisper transcription failed: {exc}") from exc
+        raise Yt2SrtError(f"MLX Whisper model could not be loaded: {exc}") from exc
+
+    speech: list[tuple[float, float]] = []
+    has_speech = True
+    if vad:
+        speech = detect_speech(audio)
+        emit_progress(progress, f"Detected {len(speech)} speech regions.")
+        has_speech = bool(speech)
+
+    result: object = {"segments": []}
+    if has_speech and vad and batch_size > 1 and not temperature_fallback:
+        try:
+            result = {
+                "segments": transcribe_regions(
+                    load_model(model_size),
+                    audio,
+                    speech,
+                    language=transcribe_kwargs.get("language"),
+                    batch_size=batch_size,
+                ),
+            }
+        except Exception as exc:
+            raise Yt2SrtError(f"MLX Whisper transcription failed: {exc}") from exc
+    elif has_speech and vad:
+        result = {
+            "segments": _transcribe_each_region(
+                mlx_whisper.transcribe,
+                audio,
+                speech,
+                path_or_hf_repo=model_repo,
+                **transcribe_kwargs,
+            ),
+        }
+    elif has_speech:
+        try:
+            result = mlx_whisper.transcribe(
+                audio,
+                path_or_hf_repo=model_repo,
+                **transcribe_kwargs,
+            )
+        except Exception as exc:
+            raise Yt2SrtError(f"MLX Whisper transcription failed: {exc}") from exc
 
     segments = _extract_segments(result)
-    srt_path = unique_srt_path(audio_file, model_size)
+    try:
+        srt_path = unique_srt_path(audio_file, model_size)
+    except OSError as exc:
+        raise Yt2SrtError(f"SRT file generation failed: {exc}") from exc
     try:
         write_srt(segments, srt_path)
     except Exception as exc:
+        srt_path.unlink(missing_ok=True)
         raise Yt2SrtError(f"SRT file generation failed: {exc}") from exc
 
     emit_progress(progress, f"Generated SRT file: {srt_path}")
     return srt_path
 
 
+def _transcribe_each_region(
+    transcribe: Callable[..., object],
+    audio: np.ndarray,
+    regions: Sequence[tuple[float, float]],
+    **transcribe_kwargs: Any,
+) -> list[dict[str, Any]]:
+    # mlx_whisper.transcribe's clip_timestamps only seeks to the first clip and then
+    # decodes every gap, so each region is transcribed from its own slice instead.
+    segments = []
+    for start, end in regions:
+        try:
+            result = transcribe(
+                audio[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)],
+                **transcribe_kwargs,
+            )
+        except Exception as exc:
+            raise Yt2SrtError(f"MLX Whisper transcription failed: {exc}") from exc
+        segments.extend(
+            {**segment, "start": segment["start"] + start, "end": segment["end"] + start}
+            for segment in _extract_segments(result)
+        )
+    return segments
+
+
 def _extract_segments(result: object) -> Sequence[Mapping[str, Any]]:
     if not isinstance(result, Mapping):
         raise Yt2SrtError("MLX Whisper returned an invalid transcription result.")
@@ -81,17 +195,18 @@ def _extract_segments(result: object) -> Sequence[Mapping[str, Any]]:
 
 
 def unique_srt_path(audio_file: Path, model_size: str) -> Path:
-    """Return a non-conflicting SRT path next to the source audio file."""
+    """Reserve a non-conflicting SRT path next to the source audio file.
 
-    base_path = audio_file.with_name(f"{audio_file.stem}_{model_size.lower()}.srt")
-    if not base_path.exists():
-        return base_path
+    The file is created exclusively, so concurrent conversions never share a
+    path. When the plain name is taken, a short random suffix is appended
+    instead of probing numbered candidates.
+    """
 
-    counter = 2
-    while True:
-        candidate = audio_file.with_name(
-            f"{audio_file.stem}_{model_size.lower()}_{counter:02d}.srt",
-        )
-        if not candidate.exists():
-            return candidate
-        counter += 1
+    stem = f"{audio_file.stem}_{model_size.lower()}"
+    srt_path = audio_file.with_name(f"{stem}.srt")
+    try:
+        srt_path.touch(exist_ok=False)
+    except FileExistsError:
+        srt_path = audio_file.with_name(f"{stem}_{uuid.uuid4().hex[:8]}.srt")
+        srt_path.touch(exist_ok=False)
+    return srt_path
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .audio import SAMPLE_RATE
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FRAME_SECONDS = 0.03
+# Frames quieter than this many dB below the loud end of the recording are silence.
+DYNAMIC_RANGE_DB = 35.0
+SILENCE_FLOOR_DB = -60.0
+
+
+def detect_speech(
+    audio: np.ndarray,
+    *,
+    sample_rate: int = SAMPLE_RATE,
+    min_silence: float = 0.5,
+    min_speech: float = 0.25,
+    padding: float = 0.2,
+) -> list[tuple[float, float]]:
+    """Return ``(start, end)`` seconds of non-silent regions using frame energy.
+
+    Regions are padded by ``padding`` seconds, merged across gaps shorter than
+    ``min_silence``, and dropped when shorter than ``min_speech``.
+    """
+
+    import numpy as np
+
+    levels = frame_levels(audio, sample_rate=sample_rate)
+    if len(levels) == 0:
+        return []
+
+    threshold = max(SILENCE_FLOOR_DB, float(np.percentile(levels, 95)) - DYNAMIC_RANGE_DB)
+
+    voiced = np.concatenate(([0], (levels > threshold).astype(np.int8), [0]))
+    edges = np.diff(voiced)
+    duration = len(audio) / sample_rate
+
+    regions: list[tuple[float, float]] = []
+    for start_frame, end_frame in zip(
+        np.flatnonzero(edges == 1),
+        np.flatnonzero(edges == -1),
+        strict=True,
+    ):
+        start = max(0.0, float(start_frame) * FRAME_SECONDS - padding)
+        end = min(duration, float(end_frame) * FRAME_SECONDS + padding)
+        if regions and start - regions[-1][1] < min_silence:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+
+    return [(start, end) for start, end in regions if end - start >= min_speech]
+
+
+def frame_levels(audio: np.ndarray, *, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Return the RMS level in dB of each consecutive ``FRAME_SECONDS`` frame."""
+
+    import numpy as np
+
+    frame_length = int(sample_rate * FRAME_SECONDS)
+    frame_count = len(audio) // frame_length
+    frames = np.asarray(audio[: frame_count * frame_length]).reshape(frame_count, frame_length)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    return 20 * np.log10(np.maximum(rms, 1e-10))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import shutil
 from collections.abc import Callable
 from pathlib import Path
@@ -9,13 +10,17 @@ from urllib.parse import urlparse
 from yt_dlp import YoutubeDL
 from yt_dlp.utils import DownloadError, PostProcessingError
 
-from .config import DEFAULT_AUDIO_FORMAT
+from .config import DEFAULT_AUDIO_FORMAT, SOURCE_AUDIO_EXTENSIONS
 from .errors import Yt2SrtError
 from .progress import ProgressCallback, emit_progress
 
 YOUTUBE_DOMAINS = ("youtube.com", "youtube-nocookie.com")
 YOUTUBE_SHORT_DOMAIN = "youtu.be"
 
+_YOUTUBE_ID_RE = re.compile(
+    r"(?:[?&]v=|/shorts/|/embed/|/live/|youtu\.be/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])",
+)
+
 
 def download_youtube_audio(
     url: str,
@@ -36,6 +41,14 @@ def download_youtube_audio(
     workspace_dir = workspace_dir.expanduser().resolve()
     workspace_dir.mkdir(parents=True, exist_ok=True)
 
+    # Reuse a previous download without asking YouTube for metadata first.
+    video_id = video_id_from_url(url)
+    if video_id is not None:
+        existing_file = _find_audio_file(workspace_dir, video_id, audio_format)
+        if existing_file is not None:
+            emit_progress(progress, f"Audio file already exists: {existing_file}")
+            return existing_file
+
     options = {
         "format": "bestaudio/best",
         "hls_use_mpegts": True,
@@ -54,11 +67,11 @@ def download_youtube_audio(
         with youtube_dl_cls(options) as ydl:
             info = ydl.extract_info(url, download=False)
             video_id = _extract_video_id(info)
-            expected_file = workspace_dir / f"youtube_{video_id}.{audio_format}"
+            existing_file = _find_audio_file(workspace_dir, video_id, audio_format)
 
-            if expected_file.exists():
-                emit_progress(progress, f"Audio file already exists: {expected_file}")
-                return expected_file
+            if existing_file is not None:
+                emit_progress(progress, f"Audio file already exists: {existing_file}")
+                return existing_file
 
             emit_progress(progress, "Downloading audio...")
             ydl.download([url])
@@ -67,11 +80,26 @@ def download_youtube_audio(
     except Exception as exc:
         raise Yt2SrtError(f"Unexpected YouTube download failure: {exc}") from exc
 
-    if not expected_file.exists():
+    audio_file = _find_audio_file(workspace_dir, video_id, audio_format)
+    if audio_file is None:
+        extension = "*" if audio_format == "best" else audio_format
+        expected_file = workspace_dir / f"youtube_{video_id}.{extension}"
         raise Yt2SrtError(f"Downloaded audio file was not found: {expected_file}")
 
-    emit_progress(progress, f"Download complete: {expected_file}")
-    return expected_file
+    emit_progress(progress, f"Download complete: {audio_file}")
+    return audio_file
+
+
+def _find_audio_file(workspace_dir: Path, video_id: str, audio_format: str) -> Path | None:
+    if audio_format != "best":
+        audio_file = workspace_dir / f"youtube_{video_id}.{audio_format}"
+        return audio_file if audio_file.exists() else None
+
+    # "best" keeps the source codec, so the extension is only known after download.
+    for audio_file in sorted(workspace_dir.glob(f"youtube_{video_id}.*")):
+        if audio_file.suffix.lstrip(".") in SOURCE_AUDIO_EXTENSIONS:
+            return audio_file
+    return None
 
 
 def _ensure_ffmpeg_available(
@@ -99,6 +127,13 @@ def _ensure_youtube_url(url: str) -> None:
     raise Yt2SrtError("Only YouTube URLs are supported; pass a youtube.com or youtu.be URL.")
 
 
+def video_id_from_url(url: str) -> str | None:
+    """Return the video id embedded in a YouTube URL, or ``None`` if it has none."""
+
+    match = _YOUTUBE_ID_RE.search(url.strip())
+    return match.group(1) if match else None
+
+
 def _extract_video_id(info: dict[str, Any] | None) -> str:
     if not info:
         raise Yt2SrtError("yt-dlp did not return video metadata.")
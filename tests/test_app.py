@@ -1,32 +1,57 @@
+import threading
 from pathlib import Path
 
-from mlx_whisper_yt2srt import app
+import pytest
+
+from mlx_whisper_yt2srt import app, models
 from mlx_whisper_yt2srt.app import ConversionOptions
+from mlx_whisper_yt2srt.errors import Yt2SrtError
+
+
+@pytest.fixture(autouse=True)
+def warmed_models(monkeypatch):
+    warmed = []
+    monkeypatch.setattr(app, "warm_model", warmed.append)
+    return warmed
 
 
 def test_conversion_options_defaults():
     options = ConversionOptions(youtube_url="https://youtu.be/example")
 
     assert options.language == "auto"
-    assert options.model_size == "turbo-4bit"
-    assert options.audio_format == "mp3"
+    assert options.model_size == "turbo-int8"
+    assert options.audio_format == "best"
     assert options.workspace_dir == Path("whisper_workspace")
+    assert options.temperature_fallback is False
+    assert options.vad is False
 
 
-def test_convert_youtube_to_srt_passes_progress_callback(monkeypatch, tmp_path):
+def test_convert_youtube_to_srt_passes_progress_callback(monkeypatch, tmp_path, warmed_models):
     audio_path = tmp_path / "audio.mp3"
     srt_path = tmp_path / "audio.srt"
     events = []
 
     def fake_download_youtube_audio(url, *, audio_format, workspace_dir, progress):
         assert url == "https://youtu.be/example"
-        assert audio_format == "mp3"
+        assert audio_format == "best"
         assert workspace_dir == Path("work")
         progress("download progress")
         return audio_path
 
-    def fake_generate_srt(audio_file, *, model_size, language, progress):
+    def fake_generate_srt(
+        audio_file,
+        *,
+        model_size,
+        language,
+        temperature_fallback,
+        vad,
+        batch_size,
+        progress,
+    ):
         assert audio_file == audio_path
+        assert temperature_fallback is True
+        assert vad is True
+        assert batch_size == 4
         assert model_size == "tiny"
         assert language == "ja"
         progress("transcription progress")
@@ -41,13 +66,217 @@ def test_convert_youtube_to_srt_passes_progress_callback(monkeypatch, tmp_path):
             language="ja",
             model_size="tiny",
             workspace_dir=Path("work"),
+            temperature_fallback=True,
+            vad=True,
+            batch_size=4,
         ),
         progress=events.append,
     )
 
     assert result == srt_path
+    assert warmed_models == ["tiny"]
     assert events == [
         "download progress",
         "Starting subtitle generation...",
         "transcription progress",
     ]
+
+
+def test_convert_youtube_to_srt_reports_warm_up_failure_without_retrying(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "warm_model", lambda _model_size: OSError("offline"))
+    monkeypatch.setattr(
+        app,
+        "download_youtube_audio",
+        lambda _url, **_options: tmp_path / "audio.mp3",
+    )
+    monkeypatch.setattr(app, "generate_srt", None)
+
+    with pytest.raises(Yt2SrtError, match="model 'tiny' could not be loaded: offline"):
+        app.convert_youtube_to_srt(
+            ConversionOptions(youtube_url="https://youtu.be/example", model_size="tiny"),
+        )
+
+
+def test_convert_youtube_to_srt_does_not_keep_failed_warm_up(monkeypatch, tmp_path):
+    loads = []
+    first_load_failed = threading.Event()
+
+    def fake_load_uncached_model(model_size, _model_repo):
+        loads.append(model_size)
+        if len(loads) == 1:
+            first_load_failed.set()
+            raise OSError("offline at t0")
+        return object()
+
+    def fake_download_youtube_audio(url, **_options):
+        if url.endswith("first"):
+            first_load_failed.wait(timeout=5)
+            raise Yt2SrtError("download failed")
+        return tmp_path / "audio.mp3"
+
+    monkeypatch.setattr(app, "warm_model", models.warm_model)
+    monkeypatch.setattr(models, "_MODEL_CACHE", {})
+    monkeypatch.setattr(models, "_load_uncached_model", fake_load_uncached_model)
+    monkeypatch.setattr(app, "download_youtube_audio", fake_download_youtube_audio)
+    monkeypatch.setattr(app, "generate_srt", lambda audio_file, **_options: audio_file)
+
+    with pytest.raises(Yt2SrtError, match="download failed"):
+        app.convert_youtube_to_srt(
+            ConversionOptions(youtube_url="https://youtu.be/first", model_size="tiny"),
+        )
+    result = app.convert_youtube_to_srt(
+        ConversionOptions(youtube_url="https://youtu.be/second", model_size="tiny"),
+    )
+
+    assert result == tmp_path / "audio.mp3"
+    assert loads == ["tiny", "tiny"]
+
+
+def test_convert_youtube_batch_downloads_in_parallel_and_transcribes_in_order(
+    monkeypatch,
+    tmp_path,
+    warmed_models,
+):
+    both_downloading = threading.Barrier(2, timeout=5)
+    transcribed = []
+
+    def fake_download_youtube_audio(url, *, audio_format, workspace_dir, progress):
+        both_downloading.wait()
+        return tmp_path / f"{url[-1]}.mp3"
+
+    def fake_generate_srt(audio_file, **_options):
+        transcribed.append(audio_file.name)
+        return audio_file.with_suffix(".srt")
+
+    monkeypatch.setattr(app, "download_youtube_audio", fake_download_youtube_audio)
+    monkeypatch.setattr(app, "generate_srt", fake_generate_srt)
+
+    result = app.convert_youtube_batch(
+        [
+            ConversionOptions(youtube_url="https://youtu.be/a"),
+            ConversionOptions(youtube_url="https://youtu.be/b"),
+        ],
+    )
+
+    assert warmed_models == ["turbo-int8"]
+    assert result == [tmp_path / "a.srt", tmp_path / "b.srt"]
+    assert transcribed == ["a.mp3", "b.mp3"]
+
+
+def test_convert_youtube_batch_downloads_repeated_urls_once(monkeypatch, tmp_path):
+    downloads = []
+
+    def fake_download_youtube_audio(url, *, audio_format, workspace_dir, progress):
+        downloads.append(url)
+        return tmp_path / "a.mp3"
+
+    monkeypatch.setattr(app, "download_youtube_audio", fake_download_youtube_audio)
+    monkeypatch.setattr(app, "generate_srt", lambda audio_file, **_options: audio_file)
+
+    result = app.convert_youtube_batch(
+        [
+            ConversionOptions(youtube_url="https://youtu.be/a", model_size="tiny"),
+            ConversionOptions(youtube_url="https://youtu.be/a", model_size="base"),
+        ],
+    )
+
+    assert downloads == ["https://youtu.be/a"]
+    assert result == [tmp_path / "a.mp3", tmp_path / "a.mp3"]
+
+
+def test_convert_youtube_batch_downloads_each_video_once_across_url_forms(monkeypatch, tmp_path):
+    downloads = []
+
+    def fake_download_youtube_audio(url, *, audio_format, workspace_dir, progress):
+        downloads.append(url)
+        return tmp_path / "abc_DEF-123.mp3"
+
+    monkeypatch.setattr(app, "download_youtube_audio", fake_download_youtube_audio)
+    monkeypatch.setattr(app, "generate_srt", lambda audio_file, **_options: audio_file)
+
+    app.convert_youtube_batch(
+        [
+            ConversionOptions(youtube_url="https://youtu.be/abc_DEF-123"),
+            ConversionOptions(youtube_url="https://www.youtube.com/watch?v=abc_DEF-123"),
+        ],
+    )
+
+    assert downloads == ["https://youtu.be/abc_DEF-123"]
+
+
+def test_convert_youtube_batch_does_not_wait_for_running_downloads_on_failure(monkeypatch):
+    b_started = threading.Event()
+    release = threading.Event()
+    b_finished = threading.Event()
+
+    def fake_download_youtube_audio(url, *, audio_format, workspace_dir, progress):
+        if url.endswith("a"):
+            b_started.wait(timeout=5)
+            raise Yt2SrtError("cannot download a")
+        b_started.set()
+        release.wait(timeout=5)
+        b_finished.set()
+        return Path("b.mp3")
+
+    monkeypatch.setattr(app, "download_youtube_audio", fake_download_youtube_audio)
+
+    try:
+        with pytest.raises(Yt2SrtError, match="cannot download a"):
+            app.convert_youtube_batch(
+                [
+                    ConversionOptions(youtube_url="https://youtu.be/a"),
+                    ConversionOptions(youtube_url="https://youtu.be/b"),
+                ],
+            )
+        assert not b_finished.is_set()
+    finally:
+        release.set()
+
+
+def test_convert_youtube_batch_rejects_mixed_formats_for_one_video(monkeypatch, warmed_models):
+    monkeypatch.setattr(app, "download_youtube_audio", None)
+
+    with pytest.raises(Yt2SrtError, match="requested as both best and mp3 audio"):
+        app.convert_youtube_batch(
+            [
+                ConversionOptions(youtube_url="https://youtu.be/abc_DEF-123"),
+                ConversionOptions(
+                    youtube_url="https://www.youtube.com/watch?v=abc_DEF-123",
+                    audio_format="mp3",
+                ),
+            ],
+        )
+
+    assert warmed_models == []
+
+
+def test_convert_youtube_batch_reports_download_failures(monkeypatch):
+    def fail_download_youtube_audio(url, *, audio_format, workspace_dir, progress):
+        raise Yt2SrtError(f"cannot download {url}")
+
+    monkeypatch.setattr(app, "download_youtube_audio", fail_download_youtube_audio)
+
+    with pytest.raises(Yt2SrtError, match="cannot download https://youtu.be/a"):
+        app.convert_youtube_batch([ConversionOptions(youtube_url="https://youtu.be/a")])
+
+
+def test_convert_youtube_batch_does_not_warm_auto_model(monkeypatch, tmp_path, warmed_models):
+    monkeypatch.setattr(
+        app,
+        "download_youtube_audio",
+        lambda url, **_options: tmp_path / f"{url[-1]}.mp3",
+    )
+    monkeypatch.setattr(app, "generate_srt", lambda audio_file, **_options: audio_file)
+
+    app.convert_youtube_batch(
+        [
+            ConversionOptions(youtube_url="https://youtu.be/a", model_size="auto"),
+            ConversionOptions(youtube_url="https://youtu.be/b", model_size="tiny"),
+        ],
+    )
+
+    assert warmed_models == ["tiny"]
+
+
+def test_convert_youtube_batch_accepts_no_urls():
+    assert app.convert_youtube_batch([]) == []
@@ -0,0 +1,63 @@
+import os
+import sys
+from types import ModuleType, SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mlx_whisper_yt2srt.audio import load_pcm, pcm_cache_path
+
+SAMPLES = np.array([0.0, 0.5, -1.0, 32767 / 32768], dtype=np.float32)
+
+
+@pytest.fixture
+def decoded(monkeypatch):
+    calls = []
+
+    def fake_load_audio(file, sr):
+        calls.append((file, sr))
+        return SAMPLES.copy()
+
+    monkeypatch.setitem(sys.modules, "mlx_whisper", ModuleType("mlx_whisper"))
+    monkeypatch.setitem(
+        sys.modules,
+        "mlx_whisper.audio",
+        SimpleNamespace(load_audio=fake_load_audio),
+    )
+    return calls
+
+
+def test_load_pcm_decodes_once_and_reuses_cache(tmp_path, decoded):
+    audio_file = tmp_path / "youtube_abc.opus"
+    audio_file.write_bytes(b"audio")
+
+    first = load_pcm(audio_file)
+    second = load_pcm(audio_file)
+
+    assert decoded == [(str(audio_file), 16000)]
+    assert pcm_cache_path(audio_file) == tmp_path / "youtube_abc.opus.pcm16.npy"
+    assert np.load(pcm_cache_path(audio_file)).dtype == np.int16
+    np.testing.assert_array_equal(first, SAMPLES)
+    np.testing.assert_array_equal(second, SAMPLES)
+    assert second.dtype == np.float32
+
+
+def test_load_pcm_decodes_again_when_audio_is_newer_than_cache(tmp_path, decoded):
+    audio_file = tmp_path / "youtube_abc.opus"
+    audio_file.write_bytes(b"audio")
+    load_pcm(audio_file)
+    cache_mtime = pcm_cache_path(audio_file).stat().st_mtime
+    os.utime(audio_file, (cache_mtime + 10, cache_mtime + 10))
+
+    load_pcm(audio_file)
+
+    assert len(decoded) == 2
+
+
+def test_load_pcm_ignores_corrupt_cache(tmp_path, decoded):
+    audio_file = tmp_path / "youtube_abc.opus"
+    audio_file.write_bytes(b"audio")
+    pcm_cache_path(audio_file).write_bytes(b"not a numpy file")
+
+    np.testing.assert_array_equal(load_pcm(audio_file), SAMPLES)
+    assert len(decoded) == 1
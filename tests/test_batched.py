@@ -0,0 +1,171 @@
+import sys
+from types import ModuleType, SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mlx_whisper_yt2srt.batched import split_regions, timestamped_segments, transcribe_regions
+
+TIMESTAMP_BEGIN = 1000
+
+
+def decode_text(tokens):
+    return " ".join(f"w{token}" for token in tokens)
+
+
+@pytest.fixture
+def fake_mlx_whisper(monkeypatch):
+    mel_calls = []
+    decoded_batches = []
+
+    def log_mel_spectrogram(audio, n_mels, padding=0):
+        mel_calls.append((len(audio), n_mels, padding))
+        # One 10 ms frame per 160 samples, as in Whisper's STFT.
+        return np.full(((len(audio) + padding) // 160, n_mels), -1.5, dtype=np.float32)
+
+    def pad_or_trim(array, length, *, axis):
+        assert axis == -2
+        padded = np.zeros((length, array.shape[1]), dtype=array.dtype)
+        padded[: min(length, len(array))] = array[:length]
+        return padded
+
+    def decode(_model, mels, _options):
+        first = sum(len(batch) for batch in decoded_batches)
+        decoded_batches.append(mels)
+        # The third window looks like silence to the decoder and is dropped.
+        return [
+            SimpleNamespace(
+                tokens=[TIMESTAMP_BEGIN, index + 1, TIMESTAMP_BEGIN + 50],
+                no_speech_prob=0.9 if index == 2 else 0.1,
+                avg_logprob=-2.0,
+            )
+            for index in range(first, first + len(mels))
+        ]
+
+    mlx = ModuleType("mlx")
+    mlx.core = SimpleNamespace(stack=np.stack, float16=np.float16)
+    audio_module = SimpleNamespace(
+        N_FRAMES=3000,
+        N_SAMPLES=480000,
+        log_mel_spectrogram=log_mel_spectrogram,
+        pad_or_trim=pad_or_trim,
+    )
+    decoding_module = SimpleNamespace(
+        DecodingOptions=lambda **options: options,
+        decode=decode,
+    )
+    tokenizer_module = SimpleNamespace(
+        get_tokenizer=lambda *_args, **_kwargs: SimpleNamespace(
+            timestamp_begin=TIMESTAMP_BEGIN,
+            decode=decode_text,
+        ),
+    )
+    monkeypatch.setitem(sys.modules, "mlx", mlx)
+    monkeypatch.setitem(sys.modules, "mlx.core", mlx.core)
+    monkeypatch.setitem(sys.modules, "mlx_whisper.audio", audio_module)
+    monkeypatch.setitem(sys.modules, "mlx_whisper.decoding", decoding_module)
+    monkeypatch.setitem(sys.modules, "mlx_whisper.tokenizer", tokenizer_module)
+    return SimpleNamespace(mel_calls=mel_calls, decoded_batches=decoded_batches)
+
+
+def test_transcribe_regions_batches_windows_padded_with_silence(fake_mlx_whisper):
+    model = SimpleNamespace(
+        is_multilingual=True,
+        num_languages=100,
+        dims=SimpleNamespace(n_mels=128),
+    )
+    audio = np.zeros(20 * 16000, dtype=np.float32)
+
+    segments = transcribe_regions(
+        model,
+        audio,
+        [(1.0, 3.0), (5.0, 6.0), (8.0, 9.0)],
+        language="en",
+        batch_size=2,
+    )
+
+    assert fake_mlx_whisper.mel_calls == [
+        (32000, 128, 480000),
+        (16000, 128, 480000),
+        (16000, 128, 480000),
+    ]
+    assert [batch.shape for batch in fake_mlx_whisper.decoded_batches] == [
+        (2, 3000, 128),
+        (1, 3000, 128),
+    ]
+    # Every frame comes from the padded waveform, not from zero-padding the mel.
+    assert all((batch == -1.5).all() for batch in fake_mlx_whisper.decoded_batches)
+    assert segments == [
+        {"start": 1.0, "end": pytest.approx(2.0), "text": "w1"},
+        {"start": 5.0, "end": 6.0, "text": "w2"},
+    ]
+
+
+def test_split_regions_cuts_long_regions_into_windows():
+    assert split_regions([(0.0, 10.0), (20.0, 85.0)], max_seconds=30.0) == [
+        (0.0, 10.0),
+        (20.0, 50.0),
+        (50.0, 80.0),
+        (80.0, 85.0),
+    ]
+
+
+def test_split_regions_cuts_at_the_quietest_frame_before_the_window_end():
+    # 30 ms frames: loud everywhere except one quiet frame at 27.0-27.03 s.
+    levels = np.full(2000, -10.0)
+    levels[900] = -50.0
+
+    windows = split_regions([(0.0, 45.0)], max_seconds=30.0, levels=levels)
+
+    assert windows == [
+        (0.0, pytest.approx(27.015)),
+        (pytest.approx(27.015), 45.0),
+    ]
+
+
+def test_split_regions_falls_back_to_hard_cut_without_levels_in_range():
+    assert split_regions([(0.0, 45.0)], max_seconds=30.0, levels=np.zeros(0)) == [
+        (0.0, 30.0),
+        (30.0, 45.0),
+    ]
+
+
+def test_timestamped_segments_splits_at_timestamp_tokens():
+    tokens = [TIMESTAMP_BEGIN, 1, 2, TIMESTAMP_BEGIN + 120, TIMESTAMP_BEGIN + 120, 3]
+
+    segments = timestamped_segments(
+        tokens,
+        timestamp_begin=TIMESTAMP_BEGIN,
+        decode_text=decode_text,
+        start=10.0,
+        end=15.0,
+    )
+
+    assert segments == [
+        {"start": 10.0, "end": pytest.approx(12.4), "text": "w1 w2"},
+        {"start": pytest.approx(12.4), "end": 15.0, "text": "w3"},
+    ]
+
+
+def test_timestamped_segments_clamps_to_window_end():
+    segments = timestamped_segments(
+        [TIMESTAMP_BEGIN, 1, TIMESTAMP_BEGIN + 1500],
+        timestamp_begin=TIMESTAMP_BEGIN,
+        decode_text=decode_text,
+        start=0.0,
+        end=5.0,
+    )
+
+    assert segments == [{"start": 0.0, "end": 5.0, "text": "w1"}]
+
+
+def test_timestamped_segments_drops_blank_text():
+    segments = timestamped_segments(
+        [TIMESTAMP_BEGIN, 1, TIMESTAMP_BEGIN + 50],
+        timestamp_begin=TIMESTAMP_BEGIN,
+        decode_text=lambda _tokens: " ",
+        start=0.0,
+        end=5.0,
+    )
+
+    assert segments == []
@@ -3,6 +3,8 @@ import sys
 from importlib.metadata import version
 from pathlib import Path
 
+import pytest
+
 from mlx_whisper_yt2srt import __version__, cli
 from mlx_whisper_yt2srt.errors import Yt2SrtError
 
@@ -14,8 +16,11 @@ def test_main_returns_zero_when_conversion_succeeds(monkeypatch, tmp_path, capsy
         assert options.youtube_url == "https://youtu.be/example"
         assert options.language == "ja"
         assert options.model_size == "tiny"
-        assert options.audio_format == "mp3"
+        assert options.audio_format == "best"
         assert options.workspace_dir == Path("work")
+        assert options.temperature_fallback is False
+        assert options.vad is False
+        assert options.batch_size == 8
         progress("core progress")
         return output_file
 
@@ -53,6 +58,70 @@ def test_main_returns_one_when_conversion_fails(monkeypatch, capsys):
     assert "Error: download failed" in captured.err
 
 
+def test_main_converts_multiple_urls_as_batch(monkeypatch, tmp_path, capsys):
+    def fake_convert_batch(options, *, progress):
+        assert [item.youtube_url for item in options] == [
+            "https://youtu.be/one",
+            "https://youtu.be/two",
+        ]
+        assert all(item.model_size == "tiny" for item in options)
+        return [tmp_path / "one.srt", tmp_path / "two.srt"]
+
+    monkeypatch.setattr(cli, "convert_youtube_batch", fake_convert_batch)
+
+    exit_code = cli.main(["https://youtu.be/one", "https://youtu.be/two", "--model", "tiny"])
+
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert f"Done! The SRT file is saved at: {tmp_path / 'one.srt'}" in captured.out
+    assert f"Done! The SRT file is saved at: {tmp_path / 'two.srt'}" in captured.out
+
+
+def test_main_composes_model_size_with_quantization(monkeypatch, tmp_path):
+    def fake_convert(options, *, progress):
+        assert options.model_size == "large-int8"
+        return tmp_path / "out.srt"
+
+    monkeypatch.setattr(cli, "convert_youtube_to_srt", fake_convert)
+
+    exit_code = cli.main(
+        ["https://youtu.be/example", "--model", "large-4bit", "--quantization", "int8"],
+    )
+
+    assert exit_code == 0
+
+
+def test_main_rejects_quantization_for_auto_model(monkeypatch, capsys):
+    monkeypatch.setattr(cli, "convert_youtube_to_srt", None)
+
+    exit_code = cli.main(["https://youtu.be/example", "--model", "auto", "--quantization", "int4"])
+
+    captured = capsys.readouterr()
+    assert exit_code == 1
+    assert "chooses its own quantization" in captured.err
+
+
+def test_main_passes_batch_size(monkeypatch, tmp_path):
+    def fake_convert(options, *, progress):
+        assert options.batch_size == 2
+        return tmp_path / "out.srt"
+
+    monkeypatch.setattr(cli, "convert_youtube_to_srt", fake_convert)
+
+    exit_code = cli.main(["https://youtu.be/example", "--vad", "--batch-size", "2"])
+
+    assert exit_code == 0
+
+
+def test_main_rejects_non_positive_batch_size(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(["https://youtu.be/example", "--batch-size", "0"])
+
+    captured = capsys.readouterr()
+    assert exc_info.value.code == 2
+    assert "expected a positive integer, got '0'" in captured.err
+
+
 def test_module_entrypoint_help_runs():
     result = subprocess.run(
         [sys.executable, "-m", "mlx_whisper_yt2srt", "--help"],
@@ -65,6 +134,23 @@ def test_module_entrypoint_help_runs():
     assert "Convert a YouTube video to an SRT subtitle file" in result.stdout
 
 
+def test_cli_import_does_not_load_mlx_or_numpy():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, mlx_whisper_yt2srt.cli; "
+            "print(sorted({'mlx', 'mlx_whisper', 'numpy'} & set(sys.modules)))",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "[]"
+
+
 def test_package_version_comes_from_installed_metadata():
     assert __version__ == version("mlx-whisper-yt2srt")
 
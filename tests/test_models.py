@@ -0,0 +1,237 @@
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from mlx_whisper_yt2srt import models
+from mlx_whisper_yt2srt.errors import Yt2SrtError
+
+
+class RepositoryNotFoundError(OSError):
+    pass
+
+
+class EntryNotFoundError(OSError):
+    pass
+
+
+class LocalEntryNotFoundError(EntryNotFoundError, FileNotFoundError):
+    pass
+
+
+@pytest.fixture
+def fake_mlx_whisper(monkeypatch):
+    loaded = []
+    quantized = []
+    unavailable_repos = set()
+    uncached_repos = set()
+
+    def fake_load_model(path_or_hf_repo, dtype):
+        loaded.append((path_or_hf_repo, dtype))
+        if path_or_hf_repo in unavailable_repos:
+            raise RepositoryNotFoundError(f"{path_or_hf_repo} not found")
+        if path_or_hf_repo in uncached_repos:
+            raise LocalEntryNotFoundError(f"{path_or_hf_repo} is not cached")
+        return SimpleNamespace(
+            repo=path_or_hf_repo,
+            parameters=lambda: {},
+            encoder=SimpleNamespace(repo=f"{path_or_hf_repo}:encoder", parameters=lambda: {}),
+            decoder=SimpleNamespace(repo=f"{path_or_hf_repo}:decoder", parameters=lambda: {}),
+        )
+
+    def fake_quantize(module, *, group_size, bits):
+        quantized.append((module.repo, group_size, bits))
+
+    mlx = ModuleType("mlx")
+    mlx.core = SimpleNamespace(float16="float16", eval=lambda *_args: None)
+    mlx.nn = SimpleNamespace(quantize=fake_quantize)
+    holder = SimpleNamespace(model=None, model_path=None)
+    monkeypatch.setitem(sys.modules, "mlx", mlx)
+    monkeypatch.setitem(sys.modules, "mlx.core", mlx.core)
+    monkeypatch.setitem(sys.modules, "mlx.nn", mlx.nn)
+    monkeypatch.setitem(sys.modules, "mlx_whisper", ModuleType("mlx_whisper"))
+    monkeypatch.setitem(
+        sys.modules,
+        "huggingface_hub.utils",
+        SimpleNamespace(
+            EntryNotFoundError=EntryNotFoundError,
+            LocalEntryNotFoundError=LocalEntryNotFoundError,
+            RepositoryNotFoundError=RepositoryNotFoundError,
+        ),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "mlx_whisper.load_models",
+        SimpleNamespace(load_model=fake_load_model),
+    )
+    monkeypatch.setitem(sys.modules, "mlx_whisper.transcribe", SimpleNamespace(ModelHolder=holder))
+    monkeypatch.setattr(models, "_MODEL_CACHE", {})
+    monkeypatch.setattr(models, "_safetensors_model_dir", lambda model_repo: model_repo)
+    return SimpleNamespace(
+        loaded=loaded,
+        quantized=quantized,
+        unavailable_repos=unavailable_repos,
+        uncached_repos=uncached_repos,
+        holder=holder,
+    )
+
+
+def test_resolve_model_repo_rejects_unknown_model():
+    with pytest.raises(Yt2SrtError, match="Unknown model 'unknown'"):
+        models.resolve_model_repo("unknown")
+
+
+@pytest.mark.parametrize(
+    ("model_size", "quantization", "expected"),
+    [
+        ("turbo", None, "turbo"),
+        ("turbo-4bit", "int8", "turbo-int8"),
+        ("Large", "int4", "large-4bit"),
+        ("large-int8", "fp16", "large"),
+    ],
+)
+def test_resolve_model_size_composes_quantization(model_size, quantization, expected):
+    assert models.resolve_model_size(model_size, quantization) == expected
+
+
+def test_resolve_model_size_rejects_quantization_for_auto():
+    with pytest.raises(Yt2SrtError, match="chooses its own quantization"):
+        models.resolve_model_size("auto", "int8")
+
+
+@pytest.mark.parametrize(
+    ("duration", "expected"),
+    [(0.0, "turbo-int8"), (599.9, "turbo-int8"), (600.0, "turbo-4bit"), (7200.0, "turbo-4bit")],
+)
+def test_pick_model_size_prefers_int8_for_short_audio(duration, expected):
+    assert models.pick_model_size(duration) == expected
+
+
+def test_load_model_reuses_cached_instance(fake_mlx_whisper):
+    first = models.load_model("tiny")
+    second = models.load_model("TINY")
+
+    assert first is second
+    assert fake_mlx_whisper.loaded == [("mlx-community/whisper-tiny-mlx", "float16")]
+
+
+def test_activate_model_installs_cached_model_for_transcribe(fake_mlx_whisper):
+    repo = models.activate_model("tiny")
+
+    assert repo == "mlx-community/whisper-tiny-mlx"
+    assert fake_mlx_whisper.holder.model is models.load_model("tiny")
+    assert fake_mlx_whisper.holder.model_path == repo
+    assert len(fake_mlx_whisper.loaded) == 1
+
+
+def test_load_model_quantizes_fp16_weights_when_quantized_repo_is_unavailable(
+    fake_mlx_whisper,
+):
+    fake_mlx_whisper.unavailable_repos.add("mlx-community/whisper-large-v3-turbo-q8")
+
+    model = models.load_model("turbo-int8")
+
+    assert model.repo == "mlx-community/whisper-large-v3-turbo"
+    assert fake_mlx_whisper.quantized == [("mlx-community/whisper-large-v3-turbo", 64, 8)]
+    assert models.load_model("turbo-int8") is model
+
+
+def test_load_model_does_not_fall_back_when_quantized_repo_is_not_cached_offline(
+    fake_mlx_whisper,
+):
+    fake_mlx_whisper.uncached_repos.add("mlx-community/whisper-large-v3-turbo-q8")
+
+    with pytest.raises(LocalEntryNotFoundError, match="turbo-q8 is not cached"):
+        models.load_model("turbo-int8")
+
+    assert len(fake_mlx_whisper.loaded) == 1
+
+
+def test_load_model_reports_quantized_repo_when_fallback_fails(fake_mlx_whisper):
+    fake_mlx_whisper.unavailable_repos.add("mlx-community/whisper-large-v3-turbo-q8")
+    fake_mlx_whisper.uncached_repos.add("mlx-community/whisper-large-v3-turbo")
+
+    with pytest.raises(RepositoryNotFoundError, match="turbo-q8 not found"):
+        models.load_model("turbo-int8")
+
+
+def test_load_model_does_not_fall_back_for_unquantized_models(fake_mlx_whisper):
+    fake_mlx_whisper.unavailable_repos.add("mlx-community/whisper-tiny-mlx")
+
+    with pytest.raises(OSError, match="not found"):
+        models.load_model("tiny")
+
+    assert fake_mlx_whisper.quantized == []
+
+
+def test_load_model_quantizes_mixed_precision_components_separately(fake_mlx_whisper):
+    mixed = models.load_model("turbo-mixed")
+    unquantized = models.load_model("turbo")
+
+    assert mixed is not unquantized
+    assert fake_mlx_whisper.quantized == [
+        ("mlx-community/whisper-large-v3-turbo:encoder", 64, 8),
+        ("mlx-community/whisper-large-v3-turbo:decoder", 64, 4),
+    ]
+
+
+def test_warm_model_returns_load_failures(fake_mlx_whisper):
+    fake_mlx_whisper.unavailable_repos.add("mlx-community/whisper-tiny-mlx")
+
+    assert isinstance(models.warm_model("tiny"), OSError)
+    assert isinstance(models.warm_model("unknown"), Yt2SrtError)
+    assert models.warm_model("base") is None
+    assert list(models._MODEL_CACHE) == ["base"]
+
+
+@pytest.fixture
+def fake_hub(monkeypatch, tmp_path):
+    snapshot_dir = tmp_path / "hub" / "snapshots" / "abc123"
+    snapshot_dir.mkdir(parents=True)
+    (snapshot_dir / "config.json").write_text("{}", encoding="utf-8")
+    saved = []
+
+    def fake_save_safetensors(file, arrays):
+        saved.append((file, arrays))
+        Path(file).write_bytes(b"safetensors")
+
+    mlx = ModuleType("mlx")
+    mlx.core = SimpleNamespace(
+        load=lambda file: {"weight": f"loaded from {Path(file).name}"},
+        save_safetensors=fake_save_safetensors,
+    )
+    monkeypatch.setitem(sys.modules, "mlx", mlx)
+    monkeypatch.setitem(sys.modules, "mlx.core", mlx.core)
+    monkeypatch.setitem(
+        sys.modules,
+        "huggingface_hub",
+        SimpleNamespace(snapshot_download=lambda repo_id: str(snapshot_dir)),
+    )
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return SimpleNamespace(snapshot_dir=snapshot_dir, saved=saved, cache=tmp_path / "cache")
+
+
+def test_safetensors_model_dir_uses_snapshot_with_safetensors(fake_hub):
+    (fake_hub.snapshot_dir / "weights.safetensors").write_bytes(b"weights")
+
+    assert models._safetensors_model_dir("org/model") == str(fake_hub.snapshot_dir)
+    assert fake_hub.saved == []
+
+
+def test_safetensors_model_dir_converts_npz_once(fake_hub):
+    (fake_hub.snapshot_dir / "weights.npz").write_bytes(b"weights")
+    converted_dir = fake_hub.cache / "mlx_whisper_yt2srt" / "models" / "org--model" / "abc123"
+
+    first = models._safetensors_model_dir("org/model")
+    second = models._safetensors_model_dir("org/model")
+
+    assert first == second == str(converted_dir)
+    assert (converted_dir / "weights.safetensors").read_bytes() == b"safetensors"
+    assert (converted_dir / "config.json").read_text(encoding="utf-8") == "{}"
+    assert len(fake_hub.saved) == 1
+    assert fake_hub.saved[0][1] == {"weight": "loaded from weights.npz"}
+    assert sorted(path.name for path in converted_dir.iterdir()) == [
+        "config.json",
+        "weights.safetensors",
+    ]
@@ -30,3 +30,11 @@ def test_write_srt_accepts_empty_segments(tmp_path):
     write_srt([], output)
 
     assert output.read_text(encoding="utf-8") == ""
+
+
+def test_write_srt_encodes_utf8_with_unix_newlines(tmp_path):
+    output = tmp_path / "ja.srt"
+
+    write_srt([{"start": 0.0, "end": 1.0, "text": "こんにちは"}], output)
+
+    assert output.read_bytes() == "1\n00:00:00,000 --> 00:00:01,000\nこんにちは\n\n".encode()
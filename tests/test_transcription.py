@@ -1,4 +1,5 @@
 import sys
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
@@ -8,20 +9,46 @@ from mlx_whisper_yt2srt.errors import Yt2SrtError
 from mlx_whisper_yt2srt.transcription import unique_srt_path
 
 
+@pytest.fixture(autouse=True)
+def skip_model_loading(monkeypatch):
+    monkeypatch.setattr(transcription, "activate_model", lambda model_size: model_size)
+
+
+@pytest.fixture(autouse=True)
+def skip_audio_decoding(monkeypatch):
+    monkeypatch.setattr(transcription, "load_pcm", lambda audio_file: f"pcm:{audio_file.name}")
+
+
 def test_unique_srt_path_returns_base_path_when_available(tmp_path):
     audio_file = tmp_path / "youtube_abc.mp3"
     audio_file.touch()
 
-    assert unique_srt_path(audio_file, "tiny") == tmp_path / "youtube_abc_tiny.srt"
+    result = unique_srt_path(audio_file, "tiny")
 
+    assert result == tmp_path / "youtube_abc_tiny.srt"
+    assert result.exists()
 
-def test_unique_srt_path_adds_counter_when_file_exists(tmp_path):
+
+def test_unique_srt_path_adds_random_suffix_when_file_exists(monkeypatch, tmp_path):
     audio_file = tmp_path / "youtube_abc.mp3"
     audio_file.touch()
-    (tmp_path / "youtube_abc_tiny.srt").touch()
-    (tmp_path / "youtube_abc_tiny_02.srt").touch()
+    (tmp_path / "youtube_abc_tiny.srt").write_text("existing", encoding="utf-8")
+    monkeypatch.setattr(transcription.uuid, "uuid4", lambda: SimpleNamespace(hex="0123abcd" * 4))
+
+    result = unique_srt_path(audio_file, "tiny")
 
-    assert unique_srt_path(audio_file, "tiny") == tmp_path / "youtube_abc_tiny_03.srt"
+    assert result == tmp_path / "youtube_abc_tiny_0123abcd.srt"
+    assert result.exists()
+    assert (tmp_path / "youtube_abc_tiny.srt").read_text(encoding="utf-8") == "existing"
+
+
+def test_unique_srt_path_never_returns_the_same_path_twice(tmp_path):
+    audio_file = tmp_path / "youtube_abc.mp3"
+    audio_file.touch()
+
+    paths = {unique_srt_path(audio_file, "tiny") for _ in range(3)}
+
+    assert len(paths) == 3
 
 
 def test_generate_srt_rejects_unknown_model(tmp_path):
@@ -32,6 +59,29 @@ def test_generate_srt_rejects_unknown_model(tmp_path):
         transcription.generate_srt(audio_file, model_size="unknown")
 
 
+def test_generate_srt_rejects_missing_audio_file(tmp_path):
+    audio_file = tmp_path / "missing.mp3"
+
+    with pytest.raises(Yt2SrtError, match="Audio file not found: .*missing.mp3"):
+        transcription.generate_srt(audio_file, model_size="tiny")
+
+
+def test_generate_srt_reports_symlink_loop_as_error(tmp_path):
+    audio_file = tmp_path / "loop.mp3"
+    audio_file.symlink_to(audio_file)
+
+    with pytest.raises(Yt2SrtError, match="Audio file could not be accessed: .*loop.mp3"):
+        transcription.generate_srt(audio_file, model_size="tiny")
+
+
+def test_generate_srt_rejects_non_positive_batch_size(tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+
+    with pytest.raises(Yt2SrtError, match="Batch size must be at least 1"):
+        transcription.generate_srt(audio_file, model_size="tiny", batch_size=0)
+
+
 def test_generate_srt_rejects_transcription_without_segments(monkeypatch, tmp_path):
     audio_file = tmp_path / "audio.mp3"
     audio_file.write_text("audio", encoding="utf-8")
@@ -90,3 +140,196 @@ def test_generate_srt_wraps_srt_write_failure(monkeypatch, tmp_path):
 
     with pytest.raises(Yt2SrtError, match="SRT file generation failed"):
         transcription.generate_srt(audio_file, model_size="tiny")
+
+    assert not (tmp_path / "audio_tiny.srt").exists()
+
+
+def test_generate_srt_wraps_srt_path_reservation_failure(monkeypatch, tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+    monkeypatch.setitem(
+        sys.modules,
+        "mlx_whisper",
+        SimpleNamespace(transcribe=lambda *_args, **_kwargs: {"segments": []}),
+    )
+
+    def fail_touch(_path, *_args, **_kwargs):
+        raise PermissionError("read-only workspace")
+
+    monkeypatch.setattr(Path, "touch", fail_touch)
+
+    with pytest.raises(Yt2SrtError, match="SRT file generation failed: read-only workspace"):
+        transcription.generate_srt(audio_file, model_size="tiny")
+
+
+def test_generate_srt_wraps_model_load_failure(monkeypatch, tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+    monkeypatch.setitem(sys.modules, "mlx_whisper", SimpleNamespace(transcribe=None))
+
+    def fail_activate_model(_model_size):
+        raise OSError("no network")
+
+    monkeypatch.setattr(transcription, "activate_model", fail_activate_model)
+
+    with pytest.raises(Yt2SrtError, match="model could not be loaded: no network"):
+        transcription.generate_srt(audio_file, model_size="tiny")
+
+
+def test_generate_srt_uses_greedy_segment_level_decoding(monkeypatch, tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+    calls = []
+
+    def fake_transcribe(audio, **kwargs):
+        calls.append(kwargs)
+        return {"segments": []}
+
+    monkeypatch.setitem(sys.modules, "mlx_whisper", SimpleNamespace(transcribe=fake_transcribe))
+
+    transcription.generate_srt(audio_file, model_size="tiny", language="ja")
+    transcription.generate_srt(audio_file, model_size="tiny", temperature_fallback=True)
+
+    assert calls[0] == {
+        "path_or_hf_repo": "mlx-community/whisper-tiny-mlx",
+        "condition_on_previous_text": False,
+        "word_timestamps": False,
+        "fp16": True,
+        "temperature": 0.0,
+        "language": "ja",
+    }
+    assert "temperature" not in calls[1]
+
+
+def test_generate_srt_with_vad_transcribes_only_speech_regions(monkeypatch, tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+    # One "sample" per second, so slices are easy to read.
+    pcm = list(range(20))
+    decoded = []
+
+    def fake_transcribe(audio, **kwargs):
+        assert "clip_timestamps" not in kwargs
+        decoded.append(audio)
+        return {"segments": [{"start": 0.5, "end": 1.0, "text": f"from {audio[0]}"}]}
+
+    monkeypatch.setitem(sys.modules, "mlx_whisper", SimpleNamespace(transcribe=fake_transcribe))
+    monkeypatch.setattr(transcription, "SAMPLE_RATE", 1)
+    monkeypatch.setattr(transcription, "load_pcm", lambda _audio_file: pcm)
+    monkeypatch.setattr(transcription, "detect_speech", lambda _audio: [(1.5, 4.0), (9.0, 12.5)])
+    events = []
+
+    result = transcription.generate_srt(
+        audio_file,
+        model_size="tiny",
+        vad=True,
+        batch_size=1,
+        progress=events.append,
+    )
+
+    assert decoded == [[1, 2, 3], [9, 10, 11]]
+    assert "Detected 2 speech regions." in events
+    assert result.read_text(encoding="utf-8") == (
+        "1\n00:00:02,000 --> 00:00:02,500\nfrom 1\n\n2\n00:00:09,500 --> 00:00:10,000\nfrom 9\n\n"
+    )
+
+
+def test_generate_srt_with_vad_skips_transcription_of_silence(monkeypatch, tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+
+    def fail_transcribe(*_args, **_kwargs):
+        raise AssertionError("silent audio should not be transcribed")
+
+    monkeypatch.setitem(sys.modules, "mlx_whisper", SimpleNamespace(transcribe=fail_transcribe))
+    monkeypatch.setattr(transcription, "load_pcm", lambda _audio_file: object())
+    monkeypatch.setattr(transcription, "detect_speech", lambda _audio: [])
+
+    result = transcription.generate_srt(audio_file, model_size="tiny", vad=True)
+
+    assert result.read_text(encoding="utf-8") == ""
+
+
+def test_generate_srt_with_vad_decodes_speech_regions_in_batches(monkeypatch, tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+    pcm = object()
+    model = object()
+    calls = []
+
+    def fake_transcribe_regions(model_arg, audio, regions, *, language, batch_size):
+        calls.append((model_arg, audio, regions, language, batch_size))
+        return [{"start": 1.5, "end": 3.0, "text": "hello"}]
+
+    monkeypatch.setitem(sys.modules, "mlx_whisper", SimpleNamespace(transcribe=None))
+    monkeypatch.setattr(transcription, "load_pcm", lambda _audio_file: pcm)
+    monkeypatch.setattr(transcription, "detect_speech", lambda _audio: [(1.5, 4.0)])
+    monkeypatch.setattr(transcription, "load_model", lambda _model_size: model)
+    monkeypatch.setattr(transcription, "transcribe_regions", fake_transcribe_regions)
+
+    result = transcription.generate_srt(
+        audio_file,
+        model_size="tiny",
+        language="en",
+        vad=True,
+        batch_size=4,
+    )
+
+    assert calls == [(model, pcm, [(1.5, 4.0)], "en", 4)]
+    assert result.read_text(encoding="utf-8") == "1\n00:00:01,500 --> 00:00:03,000\nhello\n\n"
+
+
+def test_generate_srt_passes_decoded_pcm_to_mlx_whisper(monkeypatch, tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+    calls = []
+
+    def fake_transcribe(audio, **_kwargs):
+        calls.append(audio)
+        return {"segments": []}
+
+    monkeypatch.setitem(sys.modules, "mlx_whisper", SimpleNamespace(transcribe=fake_transcribe))
+
+    transcription.generate_srt(audio_file, model_size="tiny")
+
+    assert calls == ["pcm:audio.mp3"]
+
+
+def test_generate_srt_wraps_audio_decoding_failure(monkeypatch, tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+    monkeypatch.setitem(sys.modules, "mlx_whisper", SimpleNamespace(transcribe=None))
+
+    def fail_load_pcm(_audio_file):
+        raise RuntimeError("ffmpeg failed")
+
+    monkeypatch.setattr(transcription, "load_pcm", fail_load_pcm)
+
+    with pytest.raises(Yt2SrtError, match="Audio decoding failed: ffmpeg failed"):
+        transcription.generate_srt(audio_file, model_size="tiny")
+
+
+@pytest.mark.parametrize(
+    ("seconds", "model_size"),
+    [(90, "turbo-int8"), (3600, "turbo-4bit")],
+)
+def test_generate_srt_auto_model_follows_audio_duration(monkeypatch, tmp_path, seconds, model_size):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("audio", encoding="utf-8")
+    activated = []
+    monkeypatch.setitem(
+        sys.modules,
+        "mlx_whisper",
+        SimpleNamespace(transcribe=lambda *_args, **_kwargs: {"segments": []}),
+    )
+    # One sample per second keeps the fake PCM small for long durations.
+    monkeypatch.setattr(transcription, "SAMPLE_RATE", 1)
+    monkeypatch.setattr(transcription, "load_pcm", lambda _audio_file: [0.0] * seconds)
+    monkeypatch.setattr(transcription, "activate_model", activated.append)
+    events = []
+
+    result = transcription.generate_srt(audio_file, model_size="auto", progress=events.append)
+
+    assert activated == [model_size]
+    assert result == tmp_path / f"audio_{model_size}.srt"
+    assert events[0] == f"Selected model '{model_size}' for {seconds / 60:.1f} minutes of audio."
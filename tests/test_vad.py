@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from mlx_whisper_yt2srt.vad import detect_speech
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds, amplitude=0.5):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def test_detect_speech_returns_padded_regions_around_sound():
+    audio = np.concatenate([silence(2), tone(1), silence(3), tone(2), silence(1)])
+
+    regions = detect_speech(audio)
+
+    assert len(regions) == 2
+    assert regions[0] == pytest.approx((1.8, 3.2), abs=0.04)
+    assert regions[1] == pytest.approx((5.8, 8.2), abs=0.04)
+
+
+def test_detect_speech_merges_short_gaps():
+    audio = np.concatenate([tone(1), silence(0.3), tone(1), silence(2)])
+
+    regions = detect_speech(audio)
+
+    assert len(regions) == 1
+    assert regions[0] == pytest.approx((0.0, 2.5), abs=0.04)
+
+
+def test_detect_speech_drops_short_clicks():
+    audio = np.concatenate([silence(1), tone(0.03), silence(1)])
+
+    assert detect_speech(audio, padding=0.0) == []
+
+
+def test_detect_speech_handles_silence_and_empty_audio():
+    assert detect_speech(silence(2)) == []
+    assert detect_speech(np.zeros(0, dtype=np.float32)) == []
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from mlx_whisper_yt2srt.errors import Yt2SrtError
@@ -6,6 +8,7 @@ from mlx_whisper_yt2srt.youtube import (
     _ensure_youtube_url,
     _extract_video_id,
     download_youtube_audio,
+    video_id_from_url,
 )
 
 
@@ -35,12 +38,13 @@ class FakeYoutubeDL:
     def download(self, urls):
         assert urls == ["https://youtu.be/example"]
         FakeYoutubeDL.download_called = True
+        codec = self.options["postprocessors"][0]["preferredcodec"]
         output = (
             self.options["outtmpl"]
             .replace("%(id)s", "example12345")
             .replace(
                 "%(ext)s",
-                "mp3",
+                "opus" if codec == "best" else codec,
             )
         )
         with open(output, "w", encoding="utf-8") as file:
@@ -98,6 +102,34 @@ def test_ensure_youtube_url_rejects_non_youtube_hosts(url):
         _ensure_youtube_url(url)
 
 
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=abc_DEF-123",
+        "https://www.youtube.com/watch?feature=share&v=abc_DEF-123&t=42",
+        "https://youtu.be/abc_DEF-123?si=tracking",
+        "https://youtube.com/shorts/abc_DEF-123",
+        "https://www.youtube-nocookie.com/embed/abc_DEF-123",
+        "https://www.youtube.com/live/abc_DEF-123",
+        "  https://youtu.be/abc_DEF-123  ",
+    ],
+)
+def test_video_id_from_url_matches_youtube_url_forms(url):
+    assert video_id_from_url(url) == "abc_DEF-123"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=short",
+        "https://www.youtube.com/watch?v=abc_DEF-1234",
+        "https://www.youtube.com/playlist?list=PLabc_DEF-123",
+    ],
+)
+def test_video_id_from_url_returns_none_without_a_video_id(url):
+    assert video_id_from_url(url) is None
+
+
 def test_ensure_ffmpeg_available_requires_ffmpeg():
     with pytest.raises(Yt2SrtError, match="ffmpeg was not found"):
         _ensure_ffmpeg_available(lambda _binary: None)
@@ -120,6 +152,23 @@ def test_download_youtube_audio_reuses_existing_file(tmp_path):
     assert FakeYoutubeDL.download_called is False
 
 
+def test_download_youtube_audio_reuses_existing_file_without_metadata_request(tmp_path):
+    existing_file = tmp_path / "youtube_abc_DEF-123.mp3"
+    existing_file.write_text("audio", encoding="utf-8")
+
+    def unused_youtube_dl(_options):
+        raise AssertionError("yt-dlp should not be called for a cached download")
+
+    result = download_youtube_audio(
+        "https://www.youtube.com/watch?v=abc_DEF-123",
+        workspace_dir=tmp_path,
+        youtube_dl_cls=unused_youtube_dl,
+        ffmpeg_checker=ffmpeg_found,
+    )
+
+    assert result == existing_file
+
+
 def test_download_youtube_audio_downloads_expected_file(tmp_path):
     result = download_youtube_audio(
         "https://youtu.be/example",
@@ -128,11 +177,52 @@ def test_download_youtube_audio_downloads_expected_file(tmp_path):
         ffmpeg_checker=ffmpeg_found,
     )
 
-    assert result == tmp_path / "youtube_example12345.mp3"
+    assert result == tmp_path / "youtube_example12345.opus"
     assert result.read_text(encoding="utf-8") == "audio"
     assert FakeYoutubeDL.download_called is True
 
 
+def test_download_youtube_audio_converts_to_requested_format(tmp_path):
+    result = download_youtube_audio(
+        "https://youtu.be/example",
+        audio_format="mp3",
+        workspace_dir=tmp_path,
+        youtube_dl_cls=FakeYoutubeDL,
+        ffmpeg_checker=ffmpeg_found,
+    )
+
+    assert result == tmp_path / "youtube_example12345.mp3"
+
+
+def test_download_youtube_audio_requested_format_ignores_other_extensions(tmp_path):
+    (tmp_path / "youtube_example12345.opus").write_text("audio", encoding="utf-8")
+
+    result = download_youtube_audio(
+        "https://youtu.be/example",
+        audio_format="wav",
+        workspace_dir=tmp_path,
+        youtube_dl_cls=FakeYoutubeDL,
+        ffmpeg_checker=ffmpeg_found,
+    )
+
+    assert result == tmp_path / "youtube_example12345.wav"
+    assert FakeYoutubeDL.download_called is True
+
+
+def test_download_youtube_audio_best_format_ignores_partial_downloads(tmp_path):
+    (tmp_path / "youtube_example12345.webm.part").write_text("partial", encoding="utf-8")
+
+    result = download_youtube_audio(
+        "https://youtu.be/example",
+        workspace_dir=tmp_path,
+        youtube_dl_cls=FakeYoutubeDL,
+        ffmpeg_checker=ffmpeg_found,
+    )
+
+    assert result == tmp_path / "youtube_example12345.opus"
+    assert FakeYoutubeDL.download_called is True
+
+
 def test_download_youtube_audio_requires_ffmpeg_before_extraction(tmp_path):
     with pytest.raises(Yt2SrtError, match="ffmpeg was not found"):
         download_youtube_audio(
@@ -157,9 +247,26 @@ def test_download_youtube_audio_reports_progress_via_callback(tmp_path, capsys):
     )
 
     captured = capsys.readouterr()
-    assert result == tmp_path / "youtube_example12345.mp3"
+    assert result == tmp_path / "youtube_example12345.opus"
     assert events == [
         "Downloading audio...",
-        f"Download complete: {tmp_path / 'youtube_example12345.mp3'}",
+        f"Download complete: {tmp_path / 'youtube_example12345.opus'}",
     ]
     assert captured.out == ""
+
+
+def test_download_youtube_audio_keeps_working_directory(tmp_path, monkeypatch):
+    cwd = tmp_path / "cwd"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+
+    result = download_youtube_audio(
+        "https://youtu.be/example",
+        workspace_dir=Path("workspace"),
+        youtube_dl_cls=FakeYoutubeDL,
+        ffmpeg_checker=ffmpeg_found,
+    )
+
+    assert Path.cwd() == cwd
+    assert result == cwd / "workspace" / "youtube_example12345.opus"
+    assert result.is_absolute()